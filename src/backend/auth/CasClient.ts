@@ -1,11 +1,16 @@
 import * as vscode from 'vscode';
 import { URLSearchParams } from 'url';
-import { BBFetch } from '../http/BBFetch';
+import { BBFetch, discard } from '../http/BBFetch';
 import { CredentialManager } from './CredentialManager';
-import * as cheerio from 'cheerio';
 import { log } from '../../utils/OutputChannel';
 import { updateStatusBar } from '../../frontend/statusBarItem';
 
+/**
+ * Hidden `execution` field of the CAS login form. The page is only needed
+ * for this one value, so a regex replaces a full HTML parse.
+ */
+const EXECUTION_RE = /<input\b[^>]*?\bname="execution"[^>]*?\bvalue="([^"]+)"/;
+
 /**
  * Handles CAS authentication flow for Blackboard.
  *
@@ -13,6 +18,9 @@ import { updateStatusBar } from '../../frontend/statusBarItem';
  * 1. Discover `execution` parameter on the CAS login page.  
  * 2. Submit user credentials.  
  * 3. Follow the service ticket redirect to finalise session cookies.
+ *
+ * Cookies persist on disk via `CookieStore`, so a later run usually
+ * skips the handshake after one cheap authenticated probe.
  */
 export class CasClient {
   /** CAS login endpoint (no *service* param attached). */
@@ -35,7 +43,8 @@ export class CasClient {
   /**
    * Ensures the current cookie jar represents a valid Blackboard session.
    * If a quick probe to `/ultra/course` already returns 200, the method
-   * resolves `true` immediately.
+   * resolves `true` immediately and persists the (possibly refreshed)
+   * cookies.
    *
    * All credential prompting / caching is delegated to
    * {@link CredentialManager}.
@@ -44,7 +53,10 @@ export class CasClient {
    */
   async ensureLogin(): Promise<boolean> {
     const loggedIn = await this.quickCheck();
-    if (loggedIn) {return true;}
+    if (loggedIn) {
+      this.fetch.saveCookies();
+      return true;
+    }
 
     const creds = await this.credMgr.getCredentials();
     if (!creds) {return false;}
@@ -69,6 +81,7 @@ export class CasClient {
       'https://bb.sustech.edu.cn/ultra/course', 
       { redirect: 'manual', }
     );
+    discard(res);
     if (res.status === 200) { return true; }
     if (res.status === 302) {
       const location = res.headers.get('location') || '';
@@ -78,6 +91,7 @@ export class CasClient {
       'https://bb.sustech.edu.cn/learn/api/public/v1/users/me',
       { redirect: 'manual', }
     );
+    discard(meRes);
     return meRes.status === 200;
   }
 
@@ -87,12 +101,13 @@ export class CasClient {
     const res = await this.fetch.get(url, { redirect: 'follow' });
 
     log.info('CasClient', `fetchExecution → HTTP ${res.status}`);
-    if (res.status !== 200) {return null;}
+    if (res.status !== 200) {
+      discard(res);
+      return null;
+    }
 
     const html = await res.text();
-    const $ = cheerio.load(html);
-    const exec = $('input[name="execution"]').val();
-    return exec ? String(exec) : null;
+    return EXECUTION_RE.exec(html)?.[1] ?? null;
   }
 
   /**
@@ -120,6 +135,7 @@ export class CasClient {
     const res = await this.fetch.post(url, body, {
       redirect: 'manual',
     });
+    discard(res);
 
     if (res.status !== 302) {return null;}
     const location = res.headers.get('location') ?? '';
@@ -137,8 +153,10 @@ export class CasClient {
    */
   private async validateServiceTicket(ticketURL: string): Promise<boolean> {
     const res = await this.fetch.get(ticketURL, { redirect: 'follow' });
+    discard(res);
     const ok  = res.status === 200 && res.url.includes('bb.sustech.edu.cn');
     if (ok) {this.fetch.saveCookies();}
     return ok;
   }
+
 }
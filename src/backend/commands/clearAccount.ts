@@ -1,4 +1,5 @@
 import * as vscode from 'vscode';
+import { writeFile } from 'fs/promises';
 import { CredentialManager } from '../auth/CredentialManager';
 import { CookieStore } from '../auth/CookieStore';
 import * as PathManager from '../../utils/pathManager';
@@ -11,6 +12,7 @@ import { updateStatusBar } from '../../frontend/statusBarItem';
  * - SecretStorage credentials
  * - Persistent cookies
  * - Stored ICS URL
+ * - Cached course list
  *
  * Can be used when switching accounts or troubleshooting auth errors.
  *
@@ -23,8 +25,9 @@ export async function clearAccount(context: vscode.ExtensionContext): Promise<vo
   await credMgr.clearCredentials();
   cookieStore.clear();
   await context.secrets.delete(STORE_KEY);
+  await writeFile(PathManager.getFile('courseList'), '{}', 'utf8');
 
   await updateStatusBar(credMgr);
-  log.info('clearBlackboardAccount', 'Credentials, cookies, and ICS URL cleared.');
+  log.info('clearBlackboardAccount', 'Credentials, cookies, ICS URL, and course list cleared.');
   vscode.window.showInformationMessage('Blackboard credentials and calendar URL cleared.');
 }
@@ -1,96 +1,108 @@
 import * as vscode from 'vscode';
 import * as path from 'path';
-import { writeFile } from 'fs/promises';
+import { mkdir, writeFile } from 'fs/promises';
 
 import { log } from '../../utils/OutputChannel';
-import { safeEnsureDir, safe } from '../../utils/pathUtils';
-import * as PathManager from '../../utils/pathManager';
+import { safe } from '../../utils/pathUtils';
 
-import { CookieStore } from '../auth/CookieStore';
-import { BBFetch } from '../http/BBFetch';
-import { CredentialManager } from '../auth/CredentialManager';
-import { CasClient } from '../auth/CasClient';
 import { CourseService } from '../services/CourseService';
-import { Course, Sidebar, PageContent } from '../models/CourseModels';
+import { Course, Sidebar, SidebarLink, PageContent } from '../models/CourseModels';
+
+/** Sidebar entries that link to Blackboard's help pages, not course content. */
+const HELP_LINKS = new Set(['--Get Help', '在线帮助']);
 
 /**
  * Crawls **one** Blackboard course:  
  * – Visits each sidebar page  
- * – Saves its structure as JSON  
- * – Downloads all attachments
+ * – Saves its structure as JSON, listing every attachment  
+ *
+ * Pages are fetched concurrently; the shared `BBFetch` behind
+ * `courseSvc` bounds how many requests are actually in flight, so queued
+ * pages re-check `token` after every request before touching disk. Only the
+ * folder of a page with content is created, in one recursive `mkdir`, so
+ * empty categories leave nothing behind.
  *
- * @param context   VS Code extension context (used for secret storage).
- * @param course    Target course returned by {@link CourseService.listCourses}.
- * @param termDir   Absolute path to the local term folder.
- * @param progress  VS Code progress reporter.
- * @param token     Cancellation token (user-driven).
+ * @param course     Target course returned by {@link CourseService.listCourses}.
+ * @param termDir    Absolute path to the local term folder.
+ * @param courseSvc  Course service backed by an already logged-in client.
+ * @param token      Cancellation token (user-driven).
+ * @param progress   Optional VS Code progress reporter, advanced once per
+ *                   finished page. Omit it when crawling many courses at
+ *                   once and report per course instead.
  */
 export async function crawlCourse(
-  context: vscode.ExtensionContext,
   course: Course,
   termDir: string,
-  progress: vscode.Progress<{ message?: string; increment?: number }>,
+  courseSvc: CourseService,
   token: vscode.CancellationToken,
+  progress?: vscode.Progress<{ message?: string; increment?: number }>,
 ): Promise<void> {
-  /* ── bootstrap backend services ───────────────────────────── */
-  const cookieStore = new CookieStore(PathManager.getFile('bbCookies'));
-  const fetch       = new BBFetch(cookieStore);
-  const credMgr     = new CredentialManager(context);
-  const casClient   = new CasClient(fetch, credMgr);
-  const courseSvc   = new CourseService(fetch);
-
-  /* ── authenticate once per command invocation ─────────────── */
-  if (!(await casClient.ensureLogin())) {
-    vscode.window.showErrorMessage('Blackboard login failed – aborting.');
+  /* ── retrieve sidebar structure ───────────────────────────── */
+  let sidebar: Sidebar;
+  try {
+    sidebar = await courseSvc.getSidebar(course.url);
+  } catch (err) {
+    log.error('crawlCourse', `Failed to fetch course “${course.name}”: ${err}`);
     return;
   }
-
-  /* ── retrieve sidebar structure ───────────────────────────── */
-  const sidebar = await courseSvc.getSidebar(course.url);
+  if (token.isCancellationRequested) {return;}
   if (!Object.keys(sidebar).length) {
     log.warn('crawlCourse', `Sidebar not found for course “${course.name}”.`);
     return;
   }
 
-  const courseDir = safeEnsureDir(termDir, course.name);
+  const courseDir = path.join(termDir, safe(course.name));
 
-  /* ── iterate pages and download content ───────────────────── */
+  /* ── flatten sidebar into pages, grouped by target folder ── */
+  type Page = { category: string; link: SidebarLink; dir: string };
+  const byDir = new Map<string, Page[]>();
+  let count = 0;
   for (const [category, links] of Object.entries(sidebar) as [string, Sidebar[keyof Sidebar]][]) {
-    if (token.isCancellationRequested) {return;}
-
-    progress.report({ message: `${course.name} › ${category}` });
-    const categoryDir = safeEnsureDir(courseDir, category);
-
+    const categoryDir = path.join(courseDir, safe(category));
     for (const link of links) {
-      if (token.isCancellationRequested) {return;}
-      if (link.title === '--Get Help' || link.title === '在线帮助') {return;}
+      if (HELP_LINKS.has(link.title)) {continue;}
+      const dir = path.join(categoryDir, safe(link.title));
+      if (!byDir.has(dir)) {byDir.set(dir, []);}
+      byDir.get(dir)!.push({ category, link, dir });
+      count++;
+    }
+  }
 
-      progress.report({ message: `${course.name} › ${category} › ${link.title}` });
+  /* ── fetch pages and save content concurrently ────────────── */
+  const step = 100 / count;
 
+  const crawlPage = async ({ category, link, dir: pageDir }: Page): Promise<void> => {
+    if (token.isCancellationRequested) {return;}
+    try {
       /* fetch and parse page */
       let page: PageContent;
       try {
         page = await courseSvc.getPage(link.url);
       } catch (err) {
         log.error('crawlCourse', `Failed to fetch “${link.title}”: ${err}`);
-        continue;
+        return;
       }
-      if (!Object.keys(page).length) {continue;}
+      if (token.isCancellationRequested || !Object.keys(page).length) {return;}
 
-      const pageDir = safeEnsureDir(categoryDir, link.title);
-      const queue: Array<{ url: string; path: string }> = [];
+      await mkdir(pageDir, { recursive: true });
 
-      /* save JSON & build download list */
+      /* save JSON; attachments are fetched on demand from the tree view */
       for (const [section, content] of Object.entries(page)) {
+        if (token.isCancellationRequested) {return;}
         if (!content.files.length) {continue;}
 
         const jsonPath = path.join(pageDir, `${safe(section)}.json`);
         await writeFile(jsonPath, JSON.stringify(content, null, 2), 'utf8');
-
-        for (const file of content.files) {
-          queue.push({ url: file.url, path: path.join(pageDir, safe(file.name)) });
-        }
       }
+    } finally {
+      progress?.report({ message: `${course.name} › ${category} › ${link.title}`, increment: step });
     }
-  }
+  };
+
+  /* links whose titles collide after `safe()` share a folder and its JSON
+     files; they run one after another, in sidebar order, so the last one
+     wins cleanly instead of interleaving writes */
+  await Promise.all(Array.from(byDir.values(), async (group) => {
+    for (const page of group) {await crawlPage(page);}
+  }));
 }
@@ -76,7 +76,7 @@ export async function downloadMaterial(
   const fetch       = new BBFetch(cookieStore);
   const credMgr     = new CredentialManager(context);
   const casClient   = new CasClient(fetch, credMgr);
-  const dlSvc       = new DownloadService(fetch);
+  const dlSvc       = new DownloadService(fetch, PathManager.getFile('downloadCache'));
 
   /* ── authenticate once ────────────────────────────────────── */
   if (!(await casClient.ensureLogin())) {
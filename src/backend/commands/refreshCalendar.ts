@@ -4,7 +4,7 @@ import { fetchIcsText }            from "../services/CalendarService";
 import { parseIcs }                from "../parser/CalendarParser";
 import { log }        from '../../utils/OutputChannel';
 import { CookieStore } from '../auth/CookieStore';
-import { BBFetch }     from '../http/BBFetch';
+import { BBFetch, discard } from '../http/BBFetch';
 import { CredentialManager } from '../auth/CredentialManager';
 import { CasClient }  from '../auth/CasClient';
 import * as PathManager from '../../utils/pathManager';
@@ -81,6 +81,7 @@ export async function refreshCalendar(
   /* ── call the plain‑text endpoint ──────────────────────────────── */
   const res = await fetch.get(CAL_FEED_ENDPOINT, { redirect: 'follow' });
   if (res.status !== 200) {
+    discard(res);
     log.error('syncCalendar', `HTTP ${res.status} while requesting feed URL`);
     // vscode.window.showErrorMessage(`Failed to fetch calendar feed (HTTP ${res.status}).`);
     return;
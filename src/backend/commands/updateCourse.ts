@@ -10,7 +10,7 @@ import { BBFetch } from '../http/BBFetch';
 import { CredentialManager } from '../auth/CredentialManager';
 import { CasClient } from '../auth/CasClient';
 import { CourseService } from '../services/CourseService';
-import { Course } from '../models/CourseModels';
+import { Course, CoursesByTerm } from '../models/CourseModels';
 
 import { crawlCourse } from './crawlCourse';
 import { deleteMaterial } from './deleteMaterial';
@@ -39,7 +39,7 @@ export async function updateCourse(
   const fetch       = new BBFetch(cookieStore);
   const credMgr     = new CredentialManager(context);
   const casClient   = new CasClient(fetch, credMgr);
-  const courseSvc   = new CourseService(fetch);
+  const courseSvc   = new CourseService(fetch, PathManager.getFile('courseList'));
 
   /* ── login ────────────────────────────────────────────────── */
   if (!(await casClient.ensureLogin())) {
@@ -56,9 +56,11 @@ export async function updateCourse(
       progress.report({ message: 'Fetching online course list…' });
 
       /* locate the matching online course */
-      const all = await courseSvc.listCourses();
-      const course: Course | undefined =
+      const find = (all: CoursesByTerm): Course | undefined =>
         all[termId]?.find((c) => safe(c.name) === courseName);
+      /* the cached list may predate a new enrollment */
+      const course = find(await courseSvc.listCourses())
+        ?? find(await courseSvc.listCourses(false));
 
       if (!course) {
         vscode.window.showErrorMessage(`Course “${courseName}” not found online.`);
@@ -66,7 +68,11 @@ export async function updateCourse(
       }
 
       const termDir = safeEnsureDir(bbRoot, termId);
-      await crawlCourse(context, course, termDir, progress, token);
+      await crawlCourse(course, termDir, courseSvc, token, progress);
+      if (token.isCancellationRequested) {
+        log.info('updateCourse', 'Operation cancelled by user.');
+        return;
+      }
 
       vscode.window.showInformationMessage(`Course “${courseName}” updated successfully.`);
       log.info('updateCourse', `Finished updating ${courseName}`);
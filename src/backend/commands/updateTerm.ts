@@ -47,7 +47,7 @@ export async function updateTerm(
   const fetch       = new BBFetch(cookieStore);
   const credMgr     = new CredentialManager(context);
   const casClient   = new CasClient(fetch, credMgr);
-  const courseSvc   = new CourseService(fetch);
+  const courseSvc   = new CourseService(fetch, PathManager.getFile('courseList'));
 
   if (!(await casClient.ensureLogin())) {
     vscode.window.showErrorMessage('Blackboard login failed.');
@@ -62,7 +62,8 @@ export async function updateTerm(
     async (progress, token) => {
       progress.report({ message: 'Fetching course list…' });
 
-      const all = await courseSvc.listCourses();
+      /* an explicit term refresh must see new and dropped enrollments */
+      const all = await courseSvc.listCourses(false);
       const courses: Course[] | undefined = all[termId];
 
       if (!courses?.length) {
@@ -72,12 +73,22 @@ export async function updateTerm(
 
       const termDir = safeEnsureDir(bbRoot, termId);
 
-      for (const course of courses) {
-        if (token.isCancellationRequested) {
-          log.info('updateTerm', 'Operation cancelled by user.');
-          return;
-        }
-        await crawlCourse(context, course, termDir, progress, token);
+      /* every course shares the same logged-in client and request limiter;
+         progress advances once per finished course, not per page */
+      let done = 0;
+      await Promise.all(
+        courses.map(async (course) => {
+          if (token.isCancellationRequested) {return;}
+          await crawlCourse(course, termDir, courseSvc, token);
+          progress.report({
+            message: `${++done}/${courses.length} · ${course.name}`,
+            increment: 100 / courses.length,
+          });
+        }),
+      );
+      if (token.isCancellationRequested) {
+        log.info('updateTerm', 'Operation cancelled by user.');
+        return;
       }
 
       vscode.window.showInformationMessage(`Term “${termId}” updated successfully.`);
@@ -1,6 +1,9 @@
+import { Agent as HttpAgent } from 'http';
+import { Agent as HttpsAgent } from 'https';
 import fetch, { RequestInit, Response } from 'node-fetch';
 import fetchCookie from 'fetch-cookie';
 import { CookieJar } from 'tough-cookie';
+import pLimit from 'p-limit';
 import { CookieStore } from '../auth/CookieStore';
 
 /** Default desktop user-agent for Blackboard requests. */
@@ -8,12 +11,36 @@ const USER_AGENT =
   'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 ' +
   '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36';
 
+/** Headers attached to every request unless the caller overrides them. */
+const DEFAULT_HEADERS: Readonly<Record<string, string>> = {
+  'User-Agent': USER_AGENT,
+};
+
+/**
+ * Keep-alive socket pools shared by every {@link BBFetch} instance, so
+ * consecutive and concurrent requests reuse TCP/TLS connections instead of
+ * paying a fresh handshake each time.
+ */
+const AGENT_OPTIONS = { keepAlive: true, maxSockets: 32, maxFreeSockets: 32 };
+const HTTP_AGENT  = new HttpAgent(AGENT_OPTIONS);
+const HTTPS_AGENT = new HttpsAgent(AGENT_OPTIONS);
+
+/** Gateway errors worth retrying; Blackboard emits these under load. */
+const RETRY_STATUS = new Set([502, 503, 504]);
+/** Retries after the first attempt (GET only). */
+const MAX_RETRIES = 3;
+/** Base delay for exponential back-off, in milliseconds. */
+const RETRY_BACKOFF_MS = 300;
+
 /**
  * Thin wrapper around **`node-fetch`** that
  * 1. automatically attaches / persists cookies via {@link CookieStore};  
- * 2. applies a consistent user-agent;  
+ * 2. applies a consistent user-agent over pooled keep-alive connections;  
  * 3. defaults to **manual redirect handling** (the caller decides what to do
- *    with 302 responses).
+ *    with 302 responses);
+ * 4. caps the number of in-flight requests so concurrent crawls do not
+ *    hammer `bb.sustech.edu.cn`;  
+ * 5. retries idempotent GETs on transient gateway errors.
  *
  * Every successful network round-trip is **not** persisted automatically
  * anymore; instead call {@link saveCookies} at explicit checkpoints
@@ -23,14 +50,22 @@ export class BBFetch {
   /** Low-level fetch function patched by `fetch-cookie`. */
   private readonly client: (url: string, init?: RequestInit) => Promise<Response>;
 
+  /** Limiter shared by every request issued through this instance. */
+  private readonly limit: ReturnType<typeof pLimit>;
+
   /**
-   * @param cookieStore Cookie persistence layer shared across requests.
+   * @param cookieStore  Cookie persistence layer shared across requests.
+   * @param concurrency  Max requests in flight at once (`8` by default).
    */
-  constructor(private readonly cookieStore: CookieStore) {
+  constructor(
+    private readonly cookieStore: CookieStore,
+    concurrency = 8,
+  ) {
     this.client = fetchCookie(
       fetch,
       cookieStore.cookieJar as any,
     );
+    this.limit = pLimit(concurrency);
   }
 
   /* ------------------------------------------------------------------ */
@@ -59,17 +94,29 @@ export class BBFetch {
 
   /**
    * Sends a **GET** request with sensible defaults.
+   * Network errors and 502/503/504 responses are retried with exponential
+   * back-off.
    *
    * @param url   Absolute target URL.
    * @param init  Optional fetch options (overrides defaults).
    */
   async get(url: string, init: RequestInit = {}): Promise<Response> {
-    return this.client(url, {
-      // redirect: 'manual',
-      redirect: init.redirect ?? 'manual',
-      headers: { 'User-Agent': USER_AGENT, ...(init.headers || {}) },
+    const options: RequestInit = {
       ...init,
-    });
+      redirect: init.redirect ?? 'manual',
+      headers: { ...DEFAULT_HEADERS, ...(init.headers || {}) },
+    };
+
+    for (let attempt = 0; ; attempt++) {
+      try {
+        const res = await this.send(url, options);
+        if (attempt >= MAX_RETRIES || !RETRY_STATUS.has(res.status)) {return res;}
+        discard(res);
+      } catch (err) {
+        if (attempt >= MAX_RETRIES) {throw err;}
+      }
+      await sleep(RETRY_BACKOFF_MS * 2 ** attempt);
+    }
   }
 
   /**
@@ -84,17 +131,41 @@ export class BBFetch {
     body: any,
     init: RequestInit = {},
   ): Promise<Response> {
-    return this.client(url, {
+    return this.send(url, {
       method: 'POST',
       body,
+      ...init,
+      redirect: init.redirect ?? 'manual',
       headers: {
-        'User-Agent': USER_AGENT,
+        ...DEFAULT_HEADERS,
         'Content-Type': 'application/x-www-form-urlencoded',
         ...(init.headers || {}),
       },
-      // redirect: 'manual',
-      redirect: init.redirect ?? 'manual',
-      ...init,
     });
   }
+
+  /** Issues one request through the limiter on a pooled connection. */
+  private send(url: string, init: RequestInit): Promise<Response> {
+    return this.limit(() => this.client(url, { agent: pickAgent, ...init }));
+  }
+}
+
+/**
+ * Drains a response whose body will not be read, so its socket returns to
+ * the keep-alive pool instead of staying stuck until the server times out.
+ * Callers only need this on paths that skip `text()` / streaming the body.
+ *
+ * @param res Response to throw away.
+ */
+export function discard(res: Response): void {
+  res.body.resume();
+}
+
+/** Chooses the keep-alive pool matching the request protocol. */
+function pickAgent(url: URL): HttpAgent {
+  return url.protocol === 'http:' ? HTTP_AGENT : HTTPS_AGENT;
+}
+
+function sleep(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
 }
@@ -43,6 +43,16 @@ export interface SidebarLink {
  */
 export type Sidebar = Record<string, SidebarLink[]>;
 
+/**
+ * A downloadable attachment inside a {@link PageSection}.
+ */
+export interface FileEntry {
+  /** File name as shown in Blackboard. */
+  name: string;
+  /** Absolute download URL. */
+  url: string;
+}
+
 /**
  * Rich-content block inside a Blackboard page.
  */
@@ -50,7 +60,7 @@ export interface PageSection {
   /** Text content converted from the original HTML. */
   text: string;
   /** Attached files in this block. */
-  files: Array<{ name: string; url: string }>;
+  files: FileEntry[];
 }
 
 /**
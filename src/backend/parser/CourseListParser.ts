@@ -1,11 +1,27 @@
-import * as cheerio from 'cheerio';
-import { parseStringPromise } from 'xml2js';
+import { compile, selectAll, selectOne } from 'css-select';
+import { getElementById, removeElement } from 'domutils';
+import { parseHtml, textOf, attrOf, hasAncestor } from './HtmlLoader';
 import {
   Course,
   CoursesByTerm,
   Announcement,
 } from '../models/CourseModels';
 
+/** CDATA sections of the module XML; together they hold the HTML blob. */
+const CDATA_RE = /<!\[CDATA\[([\s\S]*?)\]\]>/g;
+/** Course-list container id embedded in each term heading anchor. */
+const TERM_LIST_RE = /termCourses__\d+_\d+/;
+/** Season and year inside a term heading, e.g. `（Spring 2025）`. */
+const TERM_NAME_RE = /（(Spring|Fall|Summer|Winter)\s+(\d{4})）/;
+
+/** Selectors for the course-list blob. */
+const TERM_HEADING = compile('h3.termHeading-coursefakeclass');
+const ID_ANCHOR    = compile('a[id]');
+const LIST_ITEM    = compile('li');
+const LINK         = compile('a[href]');
+const DATA_BLOCK   = compile('div.courseDataBlock');
+const DATA_LABEL   = compile('span.dataBlockLabel');
+
 /**
  * Parses the XML response returned by Blackboard’s “refreshAjaxModule”
  * endpoint and converts it to a `{ termId → Course[] }` map.
@@ -13,52 +29,52 @@ import {
  * @param xml  Raw XML body.
  * @returns    Structured course list.
  */
-export async function parseCourseList(xml: string): Promise<CoursesByTerm> {
-  // 1. The XML wraps an HTML blob inside `<contents>`
-  const parsed = await parseStringPromise(xml, {
-    explicitArray: false,
-    trim: true,
-    explicitCharkey: true,
-  }) as { contents?: { _: string } };
-
-  const html = parsed?.contents?._ ?? '';
-  const $ = cheerio.load(html);
+export function parseCourseList(xml: string): CoursesByTerm {
+  // 1. The XML wraps an HTML blob inside `<contents><![CDATA[…]]></contents>`;
+  //    pull it out directly instead of building an XML tree around it.
+  const html = Array.from(xml.matchAll(CDATA_RE), (m) => m[1]).join('');
+  const doc = parseHtml(html);
 
   const terms: CoursesByTerm = {};
 
-  $('h3.termHeading-coursefakeclass').each((_, h3) => {
-    const termName = $(h3).text().trim();
+  for (const h3 of selectAll(TERM_HEADING, doc)) {
+    const termName = textOf(h3);
     const termId = normaliseTerm(termName);
     terms[termId] = [];
 
-    const anchor = $(h3).find('a[id]');
-    const idMatch = anchor.attr('id')?.match(/termCourses__\d+_\d+/);
-    if (!idMatch) {return;}
+    const anchor = selectOne(ID_ANCHOR, h3);
+    const idMatch = anchor && attrOf(anchor, 'id').match(TERM_LIST_RE);
+    if (!idMatch) {continue;}
     const listId = `_3_1${idMatch[0]}`;
-    const listDiv = $(`div#${listId}`);
+    const listDiv = getElementById(listId, doc);
+    if (!listDiv) {continue;}
+
+    for (const li of selectAll(LIST_ITEM, listDiv)) {
+      /* nested items belong to a course's data block, not the term */
+      if (hasAncestor(li, listDiv, 'li')) {continue;}
 
-    listDiv.find('li').each((__, li) => {
-      const a = $(li).find('a[href]').first();
-      if (!a.length || a.attr('href')?.includes('announcement')) {return;}
+      const a = selectOne(LINK, li);
+      const href = a ? attrOf(a, 'href').trim() : '';
+      if (!a || href.includes('announcement')) {continue;}
 
-      const name = a.text().trim();
-      const url = absolute((a.attr('href') ?? '').trim());;
+      const name = textOf(a);
+      const url = absolute(href);
 
       const announcement: Announcement = { content: '', url: '' };
-      const block = $(li).find('div.courseDataBlock');
-      if (block.length) {
-        block.find('span.dataBlockLabel').remove();
-        const ann = block.find('a[href]').first();
-        if (ann.length) {
-          announcement.content = ann.text().trim();
-          announcement.url = absolute((ann.attr('href') ?? '').trim());
+      const block = selectOne(DATA_BLOCK, li);
+      if (block) {
+        selectAll(DATA_LABEL, block).forEach((label) => removeElement(label));
+        const ann = selectOne(LINK, block);
+        if (ann) {
+          announcement.content = textOf(ann);
+          announcement.url = absolute(attrOf(ann, 'href').trim());
         }
       }
 
       const course: Course = { name, url, announcement };
       terms[termId]!.push(course);
-    });
-  });
+    }
+  }
 
   return terms;
 }
@@ -72,7 +88,7 @@ function absolute(href: string): string {
 
 /** Derives folder-style term ID, e.g. `（Spring 2025）` → `25spring`. */
 function normaliseTerm(termName: string): string {
-  const m = termName.match(/（(Spring|Fall|Summer|Winter)\s+(\d{4})）/);
+  const m = termName.match(TERM_NAME_RE);
   if (!m) {return termName;} // fallback
   const season = m[1].toLowerCase();
   const year = m[2].slice(-2);
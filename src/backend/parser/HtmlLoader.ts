@@ -0,0 +1,57 @@
+import { parseDocument } from 'htmlparser2';
+import { getAttributeValue, textContent } from 'domutils';
+import { isTag } from 'domhandler';
+import type { AnyNode, Document, Element } from 'domhandler';
+
+/**
+ * Parses HTML into a bare `htmlparser2` DOM.
+ *
+ * `htmlparser2` is used rather than a spec-compliant parser such as
+ * `parse5`: the pages we scrape are only queried with simple selectors.
+ * Callers query the tree with `css-select` directly, avoiding the per-node
+ * wrapper objects of a jQuery-style API, and `compile` their selectors once
+ * at module load rather than on every query.
+ *
+ * @param html Raw HTML text.
+ * @returns    Root document node.
+ */
+export function parseHtml(html: string): Document {
+  return parseDocument(html, { decodeEntities: true });
+}
+
+/**
+ * Parses `html` starting at the tag that contains `marker`, e.g.
+ * `id="courseMenuPalette_contents"`.
+ *
+ * Blackboard pages carry large `<head>` scripts and navigation chrome
+ * before the element we actually query; slicing them off means no DOM
+ * nodes are built for them. Falls back to the full document when the
+ * marker is absent.
+ *
+ * @param html   Raw HTML text.
+ * @param marker Attribute text identifying the first element of interest.
+ * @returns      Root document node of the parsed fragment.
+ */
+export function parseHtmlFrom(html: string, marker: string): Document {
+  const at = html.indexOf(marker);
+  const start = at < 0 ? -1 : html.lastIndexOf('<', at);
+  return parseHtml(start > 0 ? html.slice(start) : html);
+}
+
+/** Trimmed text content of a node, like Cheerio's `.text().trim()`. */
+export function textOf(node: AnyNode): string {
+  return textContent(node).trim();
+}
+
+/** Attribute value of an element, `''` when the attribute is missing. */
+export function attrOf(el: Element, name: string): string {
+  return getAttributeValue(el, name) ?? '';
+}
+
+/** Whether `el` has a `<tagName>` ancestor strictly below `root`. */
+export function hasAncestor(el: Element, root: Element, tagName: string): boolean {
+  for (let p = el.parent; p && p !== root; p = p.parent) {
+    if (isTag(p) && p.name === tagName) {return true;}
+  }
+  return false;
+}
@@ -1,44 +1,58 @@
-import * as cheerio from 'cheerio';
-import { PageContent } from '../models/CourseModels';
+import { compile, selectAll, selectOne } from 'css-select';
+import { hasChildren, isTag, isText } from 'domhandler';
+import type { AnyNode, Element } from 'domhandler';
+import { parseHtmlFrom, textOf, attrOf, hasAncestor } from './HtmlLoader';
+import { FileEntry, PageContent } from '../models/CourseModels';
+
+/** Selectors for a content page. */
+const CONTENT_ITEM = compile('li.clearfix.liItem.read');
+const HEADING      = compile('h3');
+const DESCRIPTION  = compile('div.vtbegenerated_div');
+const LINK         = compile('a[href]');
+
+/* Patterns used by {@link blockText}. */
+const NBSP_RE   = /\u00a0/g;
+const SPACES_RE = /[ \t]+/g;
 
 /**
  * Extracts file-centric structure from a Blackboard content page.
+ * Parsing starts at the content list (`ul#content_listContainer`), which
+ * holds every item we read.
  *
  * @param html Raw HTML of the page.
  * @returns    Structured {@link PageContent}.
  */
 export function parsePage(html: string): PageContent {
-  const $ = cheerio.load(html);
+  const doc = parseHtmlFrom(html, 'id="content_listContainer"');
   const page: PageContent = {};
 
-  $('li.clearfix.liItem.read').each((_, li) => {
-    const h3 = $(li).find('h3').first();
-    if (!h3.length) {return;}
+  for (const li of selectAll(CONTENT_ITEM, doc)) {
+    const h3 = selectOne(HEADING, li);
+    if (!h3) {continue;}
 
-    const section = h3.text().trim();
-    if (!section) {return;}
+    const section = textOf(h3);
+    if (!section) {continue;}
 
     // Extract text description
-    const text = cleanText($(li).find('div.vtbegenerated_div').html() ?? '');
+    const desc = selectOne(DESCRIPTION, li);
+    const text = desc ? blockText(desc) : '';
 
     // Collect files (excluding links inside the h3 itself)
-    const files: Array<{ name: string; url: string }> = [];
-    $(li)
-      .find('a[href]')
-      .filter((__, a) => !$(a).closest('h3').length)
-      .each((__, a) => {
-        const name = $(a).text().trim();
-        const url = toAbsolute($(a).attr('href') ?? '');
-        if (name && url) {files.push({ name, url });}
-      });
+    const files: FileEntry[] = [];
+    for (const a of selectAll(LINK, li)) {
+      if (hasAncestor(a, li, 'h3')) {continue;}
+      const name = textOf(a);
+      const url = toAbsolute(attrOf(a, 'href'));
+      if (name && url) {files.push({ name, url });}
+    }
 
     // Fallback: single file whose link is the h3 title
     if (files.length === 0) {
-      const link = h3.find('a[href]').first();
-      if (link.length) {
+      const link = selectOne(LINK, h3);
+      if (link) {
         files.push({
           name: `${section}.pdf`,
-          url: toAbsolute(link.attr('href') ?? ''),
+          url: toAbsolute(attrOf(link, 'href')),
         });
       }
     }
@@ -46,7 +60,7 @@ export function parsePage(html: string): PageContent {
     if (files.length) {
       page[section] = { text, files };
     }
-  });
+  }
 
   return page;
 }
@@ -57,12 +71,21 @@ function toAbsolute(href: string): string {
     : `https://bb.sustech.edu.cn${href}`;
 }
 
-/** Converts rich-text innerHTML to plain text with line breaks. */
-function cleanText(raw: string): string {
-  return raw
-    .replace(/<br\s*\/?>/gi, '\n')
-    .replace(/<[^>]+>/g, '')
-    .replace(/&nbsp;/g, ' ')
-    .replace(/[ \t]+/g, ' ')
+/**
+ * Converts a rich-text block to plain text with line breaks.
+ * Reads text nodes straight from the DOM rather than re-serialising the
+ * block to HTML and stripping the tags again.
+ */
+function blockText(node: Element): string {
+  return collectText(node)
+    .replace(NBSP_RE, ' ')
+    .replace(SPACES_RE, ' ')
     .trim();
 }
+
+/** Concatenates descendant text, mapping `<br>` to `\n`. */
+function collectText(node: AnyNode): string {
+  if (isText(node)) {return node.data;}
+  if (isTag(node) && node.name === 'br') {return '\n';}
+  return hasChildren(node) ? node.children.map(collectText).join('') : '';
+}
@@ -1,6 +1,13 @@
-import * as cheerio from 'cheerio';
+import { compile, selectAll, selectOne } from 'css-select';
+import { parseHtmlFrom, textOf, attrOf } from './HtmlLoader';
 import { Sidebar } from '../models/CourseModels';
 
+/** Selectors for the course menu. */
+const MENU      = compile('#courseMenuPalette_contents');
+const LIST_ITEM = compile('li');
+const HEADING   = compile('h3');
+const LINK      = compile('a[href]');
+
 /**
  * Parses the HTML of a Blackboard course page and extracts the left-hand
  * sidebar menu structure.
@@ -9,32 +16,30 @@ import { Sidebar } from '../models/CourseModels';
  * @returns    A {@link Sidebar} object. Empty when the sidebar cannot be found.
  */
 export function parseSidebar(html: string): Sidebar {
-  const $ = cheerio.load(html);
+  const doc = parseHtmlFrom(html, 'id="courseMenuPalette_contents"');
   const sidebar: Sidebar = {};
-  const menu = $('#courseMenuPalette_contents');
-  if (!menu.length) {return sidebar;}
+  const menu = selectOne(MENU, doc);
+  if (!menu) {return sidebar;}
 
   let current: string | null = null;
 
-  menu.find('li').each((_, li) => {
-    const h3 = $(li).find('h3');
-    if (h3.length) {
-      current = h3.text().trim();
+  for (const li of selectAll(LIST_ITEM, menu)) {
+    const h3 = selectOne(HEADING, li);
+    if (h3) {
+      current = textOf(h3);
       if (current) {sidebar[current] = [];}
-      return;
+      continue;
     }
 
-    if (!current) {return;}
-    const a = $(li).find('a[href]').first();
-    if (!a.length) {return;}
+    if (!current) {continue;}
+    const a = selectOne(LINK, li);
+    if (!a) {continue;}
 
-    const title = a.text().trim();
-    // const rawUrl = a.attr('href') ?? '';
-    // let url = rawUrl;
-    let url = new URL(a.attr('href') ?? '', 'https://bb.sustech.edu.cn').toString();
+    const title = textOf(a);
+    const url = new URL(attrOf(a, 'href'), 'https://bb.sustech.edu.cn').toString();
 
     sidebar[current]!.push({ title, url });
-  });
+  }
 
   return sidebar;
 }
@@ -1,4 +1,5 @@
-import { BBFetch } from '../http/BBFetch';
+import { readFile, writeFile } from 'fs/promises';
+import { BBFetch, discard } from '../http/BBFetch';
 import { parseCourseList } from '../parser/CourseListParser';
 import { parseSidebar } from '../parser/SidebarParser';
 import { parsePage } from '../parser/PageParser';
@@ -8,20 +9,54 @@ import {
   PageContent,
 } from '../models/CourseModels';
 
+/** How long a cached course list stays fresh (15 minutes). */
+const COURSE_LIST_TTL_MS = 15 * 60 * 1000;
+
+/** On-disk shape of the course list cache. */
+interface CourseListCache {
+  fetchedAt: number;
+  terms: CoursesByTerm;
+}
+
 /**
  * High-level façade that coordinates HTTP calls and parsers
  * to provide ready-to-use course data for the VS Code command layer.
+ *
+ * Sidebars and pages are memoised by URL for the lifetime of the instance
+ * (one command run), so resources linked from several places are fetched
+ * and parsed once.
  */
 export class CourseService {
+  /** Sidebar lookups by course URL, pending or settled. */
+  private readonly sidebars = new Map<string, Promise<Sidebar>>();
+  /** Page lookups by page URL, pending or settled. */
+  private readonly pages = new Map<string, Promise<PageContent>>();
+
   /**
-   * @param fetch  Pre-authenticated HTTP client.
+   * @param fetch      Pre-authenticated HTTP client.
+   * @param cacheFile  Optional JSON file caching {@link listCourses} results.
    */
-  constructor(private readonly fetch: BBFetch) {}
+  constructor(
+    private readonly fetch: BBFetch,
+    private readonly cacheFile?: string,
+  ) {}
 
   /**
    * Retrieves all courses grouped by term.
+   *
+   * The course list rarely changes, so when a `cacheFile` is configured a
+   * result younger than 15 minutes is served from disk instead of
+   * re-fetching and re-parsing the whole portal module. Callers that miss
+   * the term or course they asked for should retry with `useCache = false`.
+   *
+   * @param useCache  Set to `false` to force a fresh fetch.
    */
-  async listCourses(): Promise<CoursesByTerm> {
+  async listCourses(useCache = true): Promise<CoursesByTerm> {
+    if (useCache) {
+      const cached = await this.readCourseCache();
+      if (cached) {return cached;}
+    }
+
     const body = new URLSearchParams({
       action: 'refreshAjaxModule',
       modId: '_3_1',
@@ -33,9 +68,14 @@ export class CourseService {
       'https://bb.sustech.edu.cn/webapps/portal/execute/tabs/tabAction',
       body,
     );
-    if (res.status !== 200) {throw new Error('Failed to fetch course list');}
+    if (res.status !== 200) {
+      discard(res);
+      throw new Error('Failed to fetch course list');
+    }
     const xml = await res.text();
-    return parseCourseList(xml);
+    const terms = parseCourseList(xml);
+    await this.writeCourseCache(terms);
+    return terms;
   }
 
   /**
@@ -43,11 +83,16 @@ export class CourseService {
    *
    * @param courseURL Absolute URL of the course entry page.
    */
-  async getSidebar(courseURL: string): Promise<Sidebar> {
-    const res = await this.fetch.get(courseURL, { redirect: 'follow' });
-    if (res.status !== 200) {throw new Error('Failed to fetch course page');}
-    const html = await res.text();
-    return parseSidebar(html);
+  getSidebar(courseURL: string): Promise<Sidebar> {
+    return memoize(this.sidebars, courseURL, async () => {
+      const res = await this.fetch.get(courseURL, { redirect: 'follow' });
+      if (res.status !== 200) {
+        discard(res);
+        throw new Error('Failed to fetch course page');
+      }
+      const html = await res.text();
+      return parseSidebar(html);
+    });
   }
 
   /**
@@ -55,10 +100,59 @@ export class CourseService {
    *
    * @param pageURL Absolute URL of the Blackboard content page.
    */
-  async getPage(pageURL: string): Promise<PageContent> {
-    const res = await this.fetch.get(pageURL, { redirect: 'follow' });
-    if (res.status !== 200) {throw new Error('Failed to fetch page');}
-    const html = await res.text();
-    return parsePage(html);
+  getPage(pageURL: string): Promise<PageContent> {
+    return memoize(this.pages, pageURL, async () => {
+      const res = await this.fetch.get(pageURL, { redirect: 'follow' });
+      if (res.status !== 200) {
+        discard(res);
+        throw new Error('Failed to fetch page');
+      }
+      const html = await res.text();
+      return parsePage(html);
+    });
+  }
+
+  /** Returns the cached course list when it is still fresh. */
+  private async readCourseCache(): Promise<CoursesByTerm | null> {
+    if (!this.cacheFile) {return null;}
+    try {
+      const cache = JSON.parse(await readFile(this.cacheFile, 'utf-8')) as Partial<CourseListCache>;
+      if (!cache.fetchedAt || !cache.terms) {return null;}
+      return Date.now() - cache.fetchedAt < COURSE_LIST_TTL_MS ? cache.terms : null;
+    } catch {
+      return null;
+    }
+  }
+
+  /** Persists a freshly parsed course list; failures only cost the cache. */
+  private async writeCourseCache(terms: CoursesByTerm): Promise<void> {
+    if (!this.cacheFile || !Object.keys(terms).length) {return;}
+    const cache: CourseListCache = { fetchedAt: Date.now(), terms };
+    try {
+      await writeFile(this.cacheFile, JSON.stringify(cache), 'utf8');
+    } catch {
+      /* ignore – next call simply fetches again */
+    }
+  }
+}
+
+/**
+ * Returns the lookup for `key`, starting `load` only on the first call.
+ * Concurrent callers share the pending promise; failures are evicted so a
+ * later call can retry.
+ */
+function memoize<T>(
+  cache: Map<string, Promise<T>>,
+  key: string,
+  load: () => Promise<T>,
+): Promise<T> {
+  let hit = cache.get(key);
+  if (!hit) {
+    hit = load().catch((err) => {
+      cache.delete(key);
+      throw err;
+    });
+    cache.set(key, hit);
   }
+  return hit;
 }
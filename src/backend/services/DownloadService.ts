@@ -1,20 +1,54 @@
 import { createWriteStream } from 'fs';
-import { mkdirSync, existsSync } from 'fs';
+import { mkdir, readFile, stat, writeFile } from 'fs/promises';
 import { dirname, basename, join } from 'path';
 import { pipeline } from 'stream/promises';
 import pLimit from 'p-limit';
-import { BBFetch } from '../http/BBFetch';
+import { Response } from 'node-fetch';
+import { BBFetch, discard } from '../http/BBFetch';
+
+/**
+ * `highWaterMark` of the file write stream (256 KiB, default 16 KiB): how
+ * much downloaded data may be buffered before back-pressure pauses the
+ * response.
+ */
+const WRITE_HIGH_WATER_MARK = 1 << 18;
+
+/** HTTP validators remembered for a previously downloaded file. */
+interface CachedFile {
+  etag?: string;
+  lastModified?: string;
+  /** Where the file was saved. */
+  path: string;
+  /** Size and mtime right after the download, to detect local edits. */
+  size: number;
+  mtimeMs: number;
+}
 
 /**
  * Downloads arbitrary files with concurrency control.
+ *
+ * When a `cacheFile` is given, `ETag` / `Last-Modified` validators are
+ * persisted per URL. Re-downloading an untouched local copy then sends a
+ * conditional request and skips the body on `304 Not Modified`.
+ *
+ * All file-system work goes through `fs/promises`, so concurrent downloads
+ * never stall each other on synchronous I/O.
  */
 export class DownloadService {
+  /** Lazily loaded contents of `cacheFile`, keyed by URL. */
+  private cache?: Promise<Record<string, CachedFile>>;
+
+  /** Tail of the cache write queue; writes run one after another. */
+  private flushing: Promise<void> = Promise.resolve();
+
   /**
    * @param fetch          HTTP client (already logged-in).
+   * @param cacheFile      Optional JSON file for HTTP validators.
    * @param concurrency    Max parallel downloads (`4` by default).
    */
   constructor(
     private readonly fetch: BBFetch,
+    private readonly cacheFile?: string,
     private readonly concurrency = 4,
   ) {}
 
@@ -22,16 +56,27 @@ export class DownloadService {
    * Downloads a single file to `savePath`.  
    * Intermediate folders are created automatically.
    *
-   * @returns  `true` on success, `false` on HTTP error.
+   * @returns  `true` on success (including “not modified”), `false` on HTTP error.
    */
   async download(url: string, savePath: string): Promise<boolean> {
-    ensureDir(dirname(savePath));
+    await mkdir(dirname(savePath), { recursive: true });
 
-    const res = await this.fetch.get(url, { redirect: 'follow' });
-    if (!res.ok) {return false;}
+    const res = await this.fetch.get(url, {
+      redirect: 'follow',
+      headers: await this.conditionalHeaders(url, savePath),
+    });
+    if (res.status === 304) {
+      discard(res);
+      return true;
+    }
+    if (!res.ok) {
+      discard(res);
+      return false;
+    }
 
-    const fileStream = createWriteStream(savePath);
+    const fileStream = createWriteStream(savePath, { highWaterMark: WRITE_HIGH_WATER_MARK });
     await pipeline(res.body as any, fileStream);
+    await this.remember(url, savePath, res);
     return true;
   }
 
@@ -55,8 +100,63 @@ export class DownloadService {
       ),
     );
   }
-}
 
-function ensureDir(dir: string): void {
-  if (!existsSync(dir)) {mkdirSync(dir, { recursive: true });}
+  /**
+   * Builds `If-None-Match` / `If-Modified-Since` headers when `savePath`
+   * still holds the exact file recorded for `url`.
+   */
+  private async conditionalHeaders(url: string, savePath: string): Promise<Record<string, string>> {
+    const entry = (await this.loadCache())[url];
+    if (!entry || entry.path !== savePath) {return {};}
+
+    try {
+      const { size, mtimeMs } = await stat(savePath);
+      if (size !== entry.size || mtimeMs !== entry.mtimeMs) {return {};}
+    } catch {
+      return {};
+    }
+
+    const headers: Record<string, string> = {};
+    if (entry.etag) {headers['If-None-Match'] = entry.etag;}
+    if (entry.lastModified) {headers['If-Modified-Since'] = entry.lastModified;}
+    return headers;
+  }
+
+  /** Records the validators of a fresh download and flushes the cache. */
+  private async remember(url: string, savePath: string, res: Response): Promise<void> {
+    const file = this.cacheFile;
+    if (!file) {return;}
+
+    const cache = await this.loadCache();
+    const etag = res.headers.get('etag') ?? undefined;
+    const lastModified = res.headers.get('last-modified') ?? undefined;
+
+    if (etag || lastModified) {
+      const { size, mtimeMs } = await stat(savePath);
+      cache[url] = { etag, lastModified, path: savePath, size, mtimeMs };
+    } else {
+      delete cache[url];
+    }
+
+    /* serialise at write time so a queued flush carries the latest state */
+    this.flushing = this.flushing
+      .then(() => writeFile(file, JSON.stringify(cache)))
+      .catch(() => { /* a failed flush only costs the cache */ });
+    await this.flushing;
+  }
+
+  /** Reads `cacheFile` once; a missing or corrupt file yields an empty cache. */
+  private loadCache(): Promise<Record<string, CachedFile>> {
+    this.cache ??= this.readCache();
+    return this.cache;
+  }
+
+  private async readCache(): Promise<Record<string, CachedFile>> {
+    if (!this.cacheFile) {return {};}
+    try {
+      return JSON.parse(await readFile(this.cacheFile, 'utf-8'));
+    } catch {
+      return {};
+    }
+  }
 }
@@ -2,6 +2,7 @@ import * as vscode from 'vscode';
 import * as path from 'path';
 import * as fs from 'fs';
 import * as PathManager from '../utils/pathManager';
+import { FileEntry } from '../backend/models/CourseModels';
 
 /**
  * Provides a tree view of parsed Blackboard course materials.
@@ -151,7 +152,7 @@ export class BBMaterialViewProvider implements vscode.TreeDataProvider<BBMateria
  * Represents a single node (folder or file) in the Blackboard view.
  */
 export class BBMaterialItem extends vscode.TreeItem {
-  meta?: any[];
+  meta?: FileEntry[];
   fileUrl?: string;
 
   constructor(
@@ -18,7 +18,7 @@ import * as fs from 'fs';
 export type FolderKey = 'bb' | 'todo' | 'cache';
 
 /** Keys for single files that live inside those folders. */
-export type FileKey = 'bbCookies' | 'todoList';
+export type FileKey = 'bbCookies' | 'courseList' | 'downloadCache' | 'todoList';
 
 /** Resolved absolute path to the extension root. */
 let rootPath = '';
@@ -33,6 +33,8 @@ const folders: Record<FolderKey, string> = {
 /** File map filled by {@link initPathManager}. */
 const files: Record<FileKey, string> = {
   bbCookies: '',
+  courseList: '',
+  downloadCache: '',
   todoList: '',
 };
 
@@ -74,11 +76,15 @@ export function initPathManager(context: vscode.ExtensionContext): void {
   }
 
   /* 4 — prepare default files */
-  files.bbCookies = path.join(folders.cache, 'cookies.json');
-  files.todoList  = path.join(folders.todo,  'tasks.json');
-
-  ensureFile(files.bbCookies, {});
-  ensureFile(files.todoList,  {});
+  files.bbCookies     = path.join(folders.cache, 'cookies.json');
+  files.courseList    = path.join(folders.cache, 'courses.json');
+  files.downloadCache = path.join(folders.cache, 'downloads.json');
+  files.todoList      = path.join(folders.todo,  'tasks.json');
+
+  ensureFile(files.bbCookies,     {});
+  ensureFile(files.courseList,    {});
+  ensureFile(files.downloadCache, {});
+  ensureFile(files.todoList,      {});
 }
 
 /**
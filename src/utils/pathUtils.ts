@@ -1,23 +1,31 @@
 import * as fs from 'fs';
 import * as path from 'path';
 
+/** Characters that are illegal in Windows / POSIX file names. */
+const ILLEGAL_CHARS_RE = /[<>:"/\\|?*\x00-\x1F]/g;
+/** Leading and trailing spaces and dots. */
+const EDGE_DOTS_RE = /^[ .]+|[ .]+$/g;
+/** Device names reserved by Windows. */
+const RESERVED_WORDS = new Set([
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9',
+]);
+
 /**
  * Replace illegal characters in a name to make it filesystem-safe.
  */
 export function safe(name: string): string {
     // Replace illegal characters
-    let sanitized = name.replace(/[<>:"/\\|?*\x00-\x1F]/g, '_');
+    let sanitized = name.replace(ILLEGAL_CHARS_RE, '_');
     
     // Handle reserved names
-    const reservedWords = ['CON', 'PRN', 'AUX', 'NUL', 
-                          'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                          'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'];
-    if (reservedWords.includes(sanitized.toUpperCase())) {
+    if (RESERVED_WORDS.has(sanitized.toUpperCase())) {
         sanitized = '_' + sanitized;
     }
     
     // Remove leading and trailing spaces and dots
-    sanitized = sanitized.replace(/^[ .]+|[ .]+$/g, '');
+    sanitized = sanitized.replace(EDGE_DOTS_RE, '');
     
     // Ensure it is not empty
     if (!sanitized) {sanitized = '_';}